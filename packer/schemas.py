@@ -21,6 +21,7 @@ class PackRequest(BaseModel):
             raise ValueError("Duplicate sku values are not allowed.")
         return items
 
+# Response models document the /pack output shape; views emit plain dicts
 class BoxOutDimensions(BaseModel):
     length: int
     width: int
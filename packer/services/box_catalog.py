@@ -1,5 +1,6 @@
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import List, Tuple
 
 @dataclass(frozen=True)
 class Box:
@@ -7,10 +8,16 @@ class Box:
     length: int
     width: int
     height: int
+    # derived once at construction (catalog boxes are built at import)
+    # sorted_dims: smallest->largest, for rotation-independent fit checks
+    sorted_dims: Tuple[int, int, int] = field(init=False, repr=False, compare=False)
+    volume: int = field(init=False, repr=False, compare=False)
 
-    @property
-    def volume(self) -> int:
-        return self.length * self.width * self.height
+    def __post_init__(self):
+        object.__setattr__(
+            self, "sorted_dims", tuple(sorted((self.length, self.width, self.height)))
+        )
+        object.__setattr__(self, "volume", self.length * self.width * self.height)
 
 BOXES: List[Box] = [
     Box("BX-S", 8, 6, 4),
@@ -22,3 +29,27 @@ BOXES: List[Box] = [
 
 # keep sorted smallest->largest by volume
 BOXES_SORTED = sorted(BOXES, key=lambda b: (b.volume, b.length, b.width, b.height))
+
+def _dominates(a: Box, b: Box) -> bool:
+    # shelf packing is orientation-sensitive, so compare dims as oriented
+    return a.length >= b.length and a.width >= b.width and a.height >= b.height
+
+# candidate boxes for the packers: drop any box dominated by one scanned
+# before it, since that earlier box always wins the smallest-first scan.
+# In volume order a dominating earlier box has equal volume, so this only
+# removes exact duplicates; for the catalog above it keeps every box.
+def _frontier(boxes: List[Box]) -> List[Box]:
+    return [
+        b for i, b in enumerate(boxes)
+        if not any(_dominates(a, b) for a in boxes[:i])
+    ]
+
+BOXES_FRONTIER: List[Box] = _frontier(BOXES_SORTED)
+
+def _running_max_dim(boxes: List[Box]) -> List[int]:
+    # running max of the longest side along boxes: non-decreasing, so
+    # bisect_left(..., d) is the first index whose box (or an earlier one) is
+    # long enough for side d; every box before it is too short
+    return list(accumulate((b.sorted_dims[2] for b in boxes), max))
+
+BOXES_FRONTIER_MAX_DIM: List[int] = _running_max_dim(BOXES_FRONTIER)
@@ -1,35 +1,59 @@
-from dataclasses import dataclass
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
+from itertools import islice
 from typing import List, Optional, Tuple
 
-from .box_catalog import Box, BOXES_SORTED
+from .box_catalog import Box, BOXES_FRONTIER, BOXES_FRONTIER_MAX_DIM, BOXES_SORTED
 
-@dataclass(frozen=True)
+Dims = Tuple[int, int, int]
+
+def _orientations(a: int, b: int, c: int) -> Tuple[Dims, ...]:
+    # a, b, c: the item's l, w, h as given. Unique orientations, larger base
+    # first (helps stability), then taller, then shorter length first (leaves
+    # more of the current row free).
+    if a == b == c:
+        return ((a, a, a),)
+    ors = sorted(
+        {
+            (a, b, c), (a, c, b),
+            (b, a, c), (b, c, a),
+            (c, a, b), (c, b, a),
+        },
+        key=lambda t: (t[0] * t[1], t[2], -t[0]),
+        reverse=True,
+    )
+    return tuple(ors)
+
+def _placement_key(item: "Item") -> Tuple[int, int]:
+    # bigger items first; sorts are stable, so ties keep input order
+    return (item.volume, item.sorted_dims[2])
+
+@dataclass(frozen=True, slots=True)
 class Item:
     sku: str
     l: int
     w: int
     h: int
     order: int  # original order in input list, for stable output
+    # dims smallest->largest, for rotation-independent fit checks
+    sorted_dims: Dims = field(init=False, repr=False, compare=False)
+    # computed once; see _orientations
+    orientations: Tuple[Dims, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        sorted_dims = tuple(sorted((self.l, self.w, self.h)))
+        object.__setattr__(self, "sorted_dims", sorted_dims)
+        object.__setattr__(self, "orientations", _orientations(self.l, self.w, self.h))
 
     @property
     def volume(self) -> int:
         return self.l * self.w * self.h
 
-    def orientations(self) -> List[Tuple[int, int, int]]:
-        a, b, c = self.l, self.w, self.h
-        # 6 unique orientations
-        return list({
-            (a, b, c), (a, c, b),
-            (b, a, c), (b, c, a),
-            (c, a, b), (c, b, a),
-        })
-
-def _fits_single(item: Item, box: Box) -> bool:
-    # Items may be rotated
-    for (l, w, h) in item.orientations():
-        if l <= box.length and w <= box.width and h <= box.height:
-            return True
-    return False
+def fits_single(item: Item, box: Box) -> bool:
+    # Items may be rotated: some rotation fits iff sorted dims fit component-wise
+    a, b, c = item.sorted_dims
+    x, y, z = box.sorted_dims
+    return a <= x and b <= y and c <= z
 
 def shelf_pack_fits(items: List[Item], box: Box) -> bool:
     """
@@ -39,75 +63,78 @@ def shelf_pack_fits(items: List[Item], box: Box) -> bool:
     - then new layer in Z (height)
     Items may rotate; we pick the first orientation that fits current cursor.
     This is not optimal 3D bin packing (explicitly not required).
+    Items are placed in _placement_key order, one _try_place step each.
     """
     # place bigger items first
-    items_sorted = sorted(items, key=lambda it: (it.volume, max(it.l, it.w, it.h)), reverse=True)
-
-    x = 0
-    y = 0
-    z = 0
-
-    row_height_y = 0      # max width in current row
-    layer_height_z = 0    # max height in current layer
+    items_sorted = sorted(items, key=_placement_key, reverse=True)
 
+    cursor = _EMPTY_CURSOR
     for it in items_sorted:
-        placed = False
-
-        # Try all orientations; prefer ones with larger base first (helps stability)
-        ors = sorted(it.orientations(), key=lambda t: (t[0]*t[1], t[2]), reverse=True)
-
-        for (l, w, h) in ors:
-            # current row
-            if x + l <= box.length and y + w <= box.width and z + h <= box.height:
-                # place here
-                x += l
-                row_height_y = max(row_height_y, w)
-                layer_height_z = max(layer_height_z, h)
-                placed = True
-                break
-
-        if placed:
-            continue
-
-        # start new row
-        x = 0
-        y += row_height_y
-        row_height_y = 0
-
-        for (l, w, h) in ors:
-            if x + l <= box.length and y + w <= box.width and z + h <= box.height:
-                x += l
-                row_height_y = max(row_height_y, w)
-                layer_height_z = max(layer_height_z, h)
-                placed = True
-                break
-
-        if placed:
-            continue
+        cursor = _try_place(cursor, it.orientations, box)
+        if cursor is None:
+            return False
+    return True
 
-        # start new layer
-        x = 0
-        y = 0
-        z += layer_height_z
-        row_height_y = 0
-        layer_height_z = 0
-
-        for (l, w, h) in ors:
-            if x + l <= box.length and y + w <= box.width and z + h <= box.height:
-                x += l
-                row_height_y = max(row_height_y, w)
-                layer_height_z = max(layer_height_z, h)
-                placed = True
-                break
+# shelf cursor: (x, y, z, row_height_y, layer_height_z)
+#   row_height_y: max width in current row
+#   layer_height_z: max height in current layer
+Cursor = Tuple[int, int, int, int, int]
+_EMPTY_CURSOR: Cursor = (0, 0, 0, 0, 0)
 
-        if not placed:
-            return False
+def _try_place(cursor: Cursor, ors: Tuple[Dims, ...], box: Box) -> Optional[Cursor]:
+    """
+    Place one item at the shelf cursor: current row, else a new row,
+    else a new layer. ors is the item's precomputed Item.orientations, tried
+    in order. Returns the advanced cursor, or None if it doesn't fit.
+    """
+    # box dims as locals: this is the hot path, skip attribute lookups
+    bl, bw, bh = box.length, box.width, box.height
+    x, y, z, row_height_y, layer_height_z = cursor
+
+    # current row; free space ahead of the cursor is fixed while scanning
+    free_l, free_w, free_h = bl - x, bw - y, bh - z
+    for (l, w, h) in ors:
+        if l <= free_l and w <= free_w and h <= free_h:
+            return (
+                x + l,
+                y,
+                z,
+                w if w > row_height_y else row_height_y,
+                h if h > layer_height_z else layer_height_z,
+            )
+
+    # start new row
+    y += row_height_y
+    free_l, free_w = bl, bw - y
+    for (l, w, h) in ors:
+        if l <= free_l and w <= free_w and h <= free_h:
+            return (l, y, z, w, h if h > layer_height_z else layer_height_z)
+
+    # start new layer
+    z += layer_height_z
+    free_l, free_w, free_h = bl, bw, bh - z
+    for (l, w, h) in ors:
+        if l <= free_l and w <= free_w and h <= free_h:
+            return (l, 0, z, w, h)
 
-    return True
+    return None
 
 def find_smallest_single_box(items: List[Item]) -> Optional[Box]:
-    for box in BOXES_SORTED:
-        if all(_fits_single(it, box) for it in items) and shelf_pack_fits(items, box):
+    if len(items) == 1:
+        # one item placed at the origin: shelf packing reduces to fits_single
+        it = items[0]
+        start = bisect_left(BOXES_FRONTIER_MAX_DIM, it.sorted_dims[2])
+        return next((b for b in islice(BOXES_FRONTIER, start, None) if fits_single(it, b)), None)
+
+    # cheap lower bounds: prune boxes before any per-item check or shelf walk
+    total_v = sum(it.volume for it in items)
+    max_dim = max((it.sorted_dims[2] for it in items), default=0)
+    start = bisect_left(BOXES_FRONTIER_MAX_DIM, max_dim)
+
+    for box in islice(BOXES_FRONTIER, start, None):
+        if box.volume < total_v or box.sorted_dims[2] < max_dim:
+            continue
+        if all(fits_single(it, box) for it in items) and shelf_pack_fits(items, box):
             return box
     return None
 
@@ -115,28 +142,33 @@ def pack_into_boxes(items: List[Item]) -> List[Tuple[Box, List[Item]]]:
     """
     Multi-box heuristic:
     - First-fit decreasing by item volume
+    - Each open box keeps its shelf cursor, so placing an item is O(1) per box
     - For each item, try existing boxes (smallest total volume solution tends to emerge)
     - If none fits, open the smallest possible new box that can fit it.
     Objective priority:
       1) fewest boxes: we always try existing boxes before opening new
       2) smallest total volume: when opening, choose smallest possible box
-      3) prefer smaller boxes: enforced by scanning BOXES_SORTED
+      3) prefer smaller boxes: enforced by scanning BOXES_FRONTIER (volume order)
     """
-    items_sorted = sorted(items, key=lambda it: it.volume, reverse=True)
-    assignments: List[Tuple[Box, List[Item]]] = []
+    # same order shelf_pack_fits places items in, so each open box keeps its
+    # cursor and a trial only places the new item (no replay of the box)
+    items_sorted = sorted(items, key=_placement_key, reverse=True)
+    # (box, items, cursor, free volume), kept sorted by box volume as boxes are opened
+    open_boxes: List[Tuple[Box, List[Item], Cursor, int]] = []
 
     for it in items_sorted:
         placed = False
-
-        # try to place into an existing box (in increasing box volume order)
-        # also try smaller-used boxes first by sorting assignments by box volume
-        assignments.sort(key=lambda t: t[0].volume)
-
-        for idx, (box, box_items) in enumerate(assignments):
-            trial = box_items + [it]
-            if all(_fits_single(x, box) for x in trial) and shelf_pack_fits(trial, box):
+        volume = it.volume
+
+        # try to place into an existing box (in increasing box volume order);
+        # free volume and sorted dims reject most boxes before any placement
+        for idx, (box, box_items, cursor, free_v) in enumerate(open_boxes):
+            if free_v < volume or not fits_single(it, box):
+                continue
+            new_cursor = _try_place(cursor, it.orientations, box)
+            if new_cursor is not None:
                 box_items.append(it)
-                assignments[idx] = (box, box_items)
+                open_boxes[idx] = (box, box_items, new_cursor, free_v - volume)
                 placed = True
                 break
 
@@ -144,18 +176,19 @@ def pack_into_boxes(items: List[Item]) -> List[Tuple[Box, List[Item]]]:
             continue
 
         # open a new smallest box that can fit the item alone
-        new_box = None
-        for b in BOXES_SORTED:
-            if _fits_single(it, b) and shelf_pack_fits([it], b):
-                new_box = b
-                break
+        new_box = find_smallest_single_box([it])
 
         if new_box is None:
             # no available box fits this item at all
             raise ValueError(f"Item '{it.sku}' does not fit in any available box.")
 
-        assignments.append((new_box, [it]))
+        # placing at the origin cannot fail once the item fits the box
+        cursor = _try_place(_EMPTY_CURSOR, it.orientations, new_box)
+        insort(
+            open_boxes,
+            (new_box, [it], cursor, new_box.volume - volume),
+            key=lambda t: t[0].volume,
+        )
 
-    # final sort for stable output: smallest boxes first
-    assignments.sort(key=lambda t: t[0].volume)
-    return assignments
+    # already smallest boxes first, for stable output
+    return [(box, box_items) for box, box_items, _, _ in open_boxes]
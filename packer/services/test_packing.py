@@ -1,9 +1,12 @@
+import itertools
 import unittest
+from unittest import mock
 
-from packer.services.box_catalog import Box
+from packer.services import packing
+from packer.services.box_catalog import BOXES_FRONTIER, Box, _frontier, _running_max_dim
 from packer.services.packing import (
     Item,
-    _fits_single,
+    fits_single,
     shelf_pack_fits,
     find_smallest_single_box,
     pack_into_boxes,
@@ -23,23 +26,59 @@ class TestPacking(unittest.TestCase):
     def largest_box(self):
         return BOXES_SORTED[-1]
 
-    # ---------- _fits_single ----------
+    # ---------- Item.orientations ----------
+    def test_orientations_unique_and_larger_base_first(self):
+        item = Item(sku="ors", l=3, w=2, h=1, order=1)
+        ors = item.orientations
+        self.assertEqual(len(ors), 6)
+        self.assertEqual(len(set(ors)), 6)
+        bases = [l * w for (l, w, _) in ors]
+        self.assertEqual(bases, sorted(bases, reverse=True))
+
+    def test_orientations_degenerate_shapes(self):
+        self.assertEqual(Item("cube", 4, 4, 4, 1).orientations, ((4, 4, 4),))
+        self.assertEqual(len(Item("sq", 2, 5, 2, 1).orientations), 3)
+
+    def test_orientations_equal_base_shorter_length_first(self):
+        # among rotations with the same base and height, the shorter length
+        # leaves more of the current row free; input order of l/w/h is irrelevant
+        expected = ((2, 3, 1), (3, 2, 1), (1, 3, 2), (3, 1, 2), (1, 2, 3), (2, 1, 3))
+        for dims in itertools.permutations((1, 2, 3)):
+            self.assertEqual(Item("ors", *dims, 1).orientations, expected)
+
+    def test_orientation_tie_break_keeps_small_batch_in_one_box(self):
+        # with the set-order tie-break these needed BX-M; shorter-length-first
+        # leaves room in the row for the cube, so BX-S holds both
+        items = [Item("a", 3, 3, 3, 1), Item("b", 4, 3, 6, 2)]
+        result = find_smallest_single_box(items)
+        self.assertIsNotNone(result)
+        self.assertEqual(result.box_id, "BX-S")
+
+    def test_orientations_do_not_affect_equality(self):
+        self.assertEqual(Item("a", 3, 2, 1, 1), Item("a", 3, 2, 1, 1))
+
+    # ---------- fits_single ----------
     def test_item_fits_exactly(self):
         item = Item(sku="test", l=10, w=5, h=3, order=1)
         # use a real catalog box that is >= these dims
         box = self.largest_box()
-        self.assertTrue(_fits_single(item, box))
+        self.assertTrue(fits_single(item, box))
 
     def test_item_does_not_fit(self):
         item = Item(sku="test", l=10_000, w=10_000, h=10_000, order=1)
-        self.assertFalse(_fits_single(item, self.largest_box()))
+        self.assertFalse(fits_single(item, self.largest_box()))
 
     def test_item_fits_when_rotated(self):
         # Pick something that should fit when rotated in most sane catalogs:
         # e.g., (8,3,2) should fit into a box that has dims like (12,10,6) etc.
         item = Item(sku="rot", l=8, w=3, h=2, order=1)
         box = self.medium_box()
-        self.assertTrue(_fits_single(item, box))
+        self.assertTrue(fits_single(item, box))
+
+    def test_item_fits_only_in_some_rotation(self):
+        box = Box(box_id="BX", length=2, width=10, height=5)
+        self.assertTrue(fits_single(Item("flat", 10, 5, 2, 1), box))
+        self.assertFalse(fits_single(Item("tall", 10, 6, 2, 1), box))
 
     # ---------- shelf_pack_fits ----------
     def test_shelf_pack_empty_items_list_is_true(self):
@@ -47,7 +86,7 @@ class TestPacking(unittest.TestCase):
 
     def test_shelf_pack_single_item_fits(self):
         item = Item(sku="one", l=2, w=2, h=1, order=1)
-        self.assertTrue(shelf_pack_fits([item], self.smallest_box() if _fits_single(item, self.smallest_box()) else self.medium_box()))
+        self.assertTrue(shelf_pack_fits([item], self.smallest_box() if fits_single(item, self.smallest_box()) else self.medium_box()))
 
     def test_shelf_pack_single_item_does_not_fit(self):
         item = Item(sku="huge", l=10_000, w=10_000, h=10_000, order=1)
@@ -61,7 +100,7 @@ class TestPacking(unittest.TestCase):
         ]
         box = self.medium_box()
         # If your medium box is too small in some catalogs, fall back to largest to avoid flake
-        if not all(_fits_single(it, box) for it in items):
+        if not all(fits_single(it, box) for it in items):
             box = self.largest_box()
         self.assertTrue(shelf_pack_fits(items, box))
 
@@ -70,7 +109,7 @@ class TestPacking(unittest.TestCase):
         item = Item(sku="test", l=1, w=1, h=1, order=1)
         result = find_smallest_single_box([item])
         self.assertIsNotNone(result)
-        self.assertTrue(_fits_single(item, result))
+        self.assertTrue(fits_single(item, result))
         self.assertTrue(shelf_pack_fits([item], result))
 
     def test_find_smallest_single_box_returns_smallest_possible(self):
@@ -80,7 +119,7 @@ class TestPacking(unittest.TestCase):
 
         # No smaller box should also fit + pack
         for smaller_box in [b for b in BOXES_SORTED if b.volume < result.volume]:
-            if _fits_single(item, smaller_box):
+            if fits_single(item, smaller_box):
                 self.assertFalse(shelf_pack_fits([item], smaller_box))
 
     def test_find_smallest_single_box_empty_list_returns_smallest_box(self):
@@ -89,6 +128,63 @@ class TestPacking(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertEqual(result.box_id, self.smallest_box().box_id)
 
+    def test_find_smallest_single_box_skips_boxes_below_total_volume(self):
+        # each item fits the smallest box alone, together they need more volume;
+        # the volume bound must reject that box before any shelf walk
+        smallest = self.smallest_box()
+        l, w, h = smallest.length, smallest.width, smallest.height
+        items = [Item("a", l, w, h, 1), Item("b", l, w, h, 2)]
+        with mock.patch.object(
+            packing, "shelf_pack_fits", wraps=packing.shelf_pack_fits
+        ) as walk:
+            result = find_smallest_single_box(items)
+        self.assertIsNotNone(result)
+        self.assertGreaterEqual(result.volume, 2 * smallest.volume)
+        walked = [call.args[1] for call in walk.call_args_list]
+        self.assertTrue(walked)
+        self.assertNotIn(smallest, walked)
+
+    def test_find_smallest_single_box_bisect_never_skips_a_fitting_box(self):
+        # volume order does not follow longest-side order: the long thin box
+        # is smallest by volume. A bisect over raw max dims [30, 7, 8, 9]
+        # would skip it for a 20-long item; the running max must not.
+        catalog = [
+            Box("LONG", 30, 3, 3),
+            Box("C7", 7, 7, 7),
+            Box("C8", 8, 8, 8),
+            Box("C9", 9, 9, 9),
+        ]
+        max_dims = _running_max_dim(catalog)
+        self.assertEqual(max_dims, [30, 30, 30, 30])
+
+        def linear_scan(items):
+            for box in catalog:
+                if all(fits_single(it, box) for it in items) and shelf_pack_fits(items, box):
+                    return box
+            return None
+
+        with mock.patch.object(packing, "BOXES_FRONTIER", catalog), \
+                mock.patch.object(packing, "BOXES_FRONTIER_MAX_DIM", max_dims):
+            self.assertEqual(find_smallest_single_box([Item("rod", 20, 2, 2, 1)]).box_id, "LONG")
+            for dims in itertools.product((1, 2, 3, 5, 8, 9, 20, 31), repeat=3):
+                single = [Item("x", *dims, 1)]
+                pair = [Item("x", *dims, 1), Item("y", 2, 2, 2, 2)]
+                for items in (single, pair):
+                    self.assertEqual(find_smallest_single_box(items), linear_scan(items), dims)
+
+    # ---------- BOXES_FRONTIER ----------
+    def test_frontier_drops_duplicate_dims_keeps_earlier_box(self):
+        first = Box("A", 8, 6, 4)
+        dup = Box("B", 8, 6, 4)
+        rotated = Box("C", 6, 8, 4)  # same volume, not dominated as oriented
+        bigger = Box("D", 12, 10, 6)
+        frontier = _frontier([first, dup, rotated, bigger])
+        self.assertEqual([b.box_id for b in frontier], ["A", "C", "D"])
+        self.assertIs(frontier[0], first)
+
+    def test_frontier_keeps_every_catalog_box(self):
+        self.assertEqual(BOXES_FRONTIER, BOXES_SORTED)
+
     def test_find_smallest_single_box_no_fit(self):
         items = [
             Item(sku="huge1", l=10_000, w=10_000, h=10_000, order=1),
@@ -108,7 +204,7 @@ class TestPacking(unittest.TestCase):
         self.assertEqual(len(result), 1)
         box, packed_items = result[0]
         self.assertEqual(packed_items, [item])
-        self.assertTrue(_fits_single(item, box))
+        self.assertTrue(fits_single(item, box))
         self.assertTrue(shelf_pack_fits(packed_items, box))
 
     def test_pack_into_boxes_item_too_large_raises(self):
@@ -128,12 +224,39 @@ class TestPacking(unittest.TestCase):
         for box, its in result:
             # every item in a returned box must fit that box
             for it in its:
-                self.assertTrue(_fits_single(it, box))
+                self.assertTrue(fits_single(it, box))
             self.assertTrue(shelf_pack_fits(its, box))
             packed.extend(its)
 
         self.assertCountEqual([it.sku for it in packed], [it.sku for it in items])
 
+    def test_pack_into_boxes_adds_to_open_box_before_opening_new(self):
+        # the second cube only has to fit the already-open box alongside the first
+        box = self.smallest_box()
+        side = min(box.length // 2, box.width, box.height)
+        items = [Item("a", side, side, side, 1), Item("b", side, side, side, 2)]
+        result = pack_into_boxes(items)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0][0].box_id, box.box_id)
+        self.assertCountEqual([it.sku for it in result[0][1]], ["a", "b"])
+
+    def test_pack_into_boxes_equal_volume_batch_is_pinned(self):
+        # all volume 392, no single box holds them. Equal-volume items are
+        # visited longest side first (_placement_key), so b joins c and d in
+        # the BX-XL; visiting them in input order takes three boxes.
+        items = [
+            Item("a", 4, 7, 14, 1),
+            Item("b", 7, 8, 7, 2),
+            Item("c", 2, 14, 14, 3),
+            Item("d", 14, 14, 2, 4),
+        ]
+        self.assertIsNone(find_smallest_single_box(items))
+        result = pack_into_boxes(items)
+        self.assertEqual(
+            [(box.box_id, sorted(it.sku for it in its)) for box, its in result],
+            [("BX-L", ["a"]), ("BX-XL", ["b", "c", "d"])],
+        )
+
     def test_pack_into_boxes_output_boxes_sorted_by_volume_if_multiple(self):
         items = [
             Item(sku="a", l=8, w=8, h=8, order=1),
@@ -76,3 +76,29 @@ class PackEndpointTests(TestCase):
         for b in body["boxes"]:
             idxs = [order[sku] for sku in b["items"]]
             self.assertEqual(idxs, sorted(idxs))
+
+    def test_lax_dimension_types_still_accepted(self):
+        # not handled by the fast validator; falls back to Pydantic's coercion
+        payload = {
+            "items": [
+                {"sku": "A", "dimensions": {"length": "6", "width": 4.0, "height": 4}},
+            ]
+        }
+        r = self.post_pack(payload)
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.json()["total_boxes"], 1)
+
+    def test_item_too_large_with_integer_beyond_64_bits_422(self):
+        # as a JSON number and as a string Pydantic coerces; both must echo the exact value
+        big = 10**29
+        for length in (big, str(big)):
+            payload = {
+                "items": [
+                    {"sku": "A", "dimensions": {"length": length, "width": 4, "height": 4}},
+                ]
+            }
+            r = self.post_pack(payload)
+            self.assertEqual(r.status_code, 422)
+            body = r.json()
+            self.assertEqual(body["error"], "item_too_large")
+            self.assertEqual(body["details"][0]["dimensions"]["length"], big)
@@ -5,4 +5,3 @@ urlpatterns = [
     path("health", health, name="health"),  # GET /health
     path("pack", pack, name="pack"),        # POST /pack
 ]
-print("Loaded packer.urls:", [str(p.pattern) for p in urlpatterns])
\ No newline at end of file
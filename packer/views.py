@@ -1,18 +1,18 @@
 import json
-from itertools import permutations
 
-from django.http import JsonResponse, HttpRequest
+from django.http import HttpRequest, HttpResponse
 from django.views.decorators.http import require_POST, require_GET
+import orjson
 from pydantic import ValidationError
 
-from .schemas import PackRequest, PackResponse, PackedBox, BoxOutDimensions
-from .services.packing import Item, find_smallest_single_box, pack_into_boxes
-from .services.box_catalog import BOXES
+from .schemas import PackRequest
+from .services.packing import Item, fits_single, find_smallest_single_box, pack_into_boxes
+from .services.box_catalog import BOXES_SORTED
 
 
 @require_GET
 def health(request: HttpRequest):
-    return JsonResponse({"ok": True, "path": request.path}, status=200)
+    return _json_response({"ok": True, "path": request.path}, status=200)
 
 @require_POST
 def pack(request: HttpRequest):
@@ -27,48 +27,51 @@ def pack(request: HttpRequest):
     
     # 1) Parse JSON
     try:
-        payload = json.loads(request.body.decode("utf-8") or "{}")
-    except json.JSONDecodeError as e:
+        payload = orjson.loads(request.body or b"{}")
+    except orjson.JSONDecodeError as e:
         return error_response("invalid_json", 400, details=e.msg)
 
-    # 2) Validate input via Pydantic
-    try:
-        req = PackRequest.model_validate(payload)
-    except ValidationError as e:
-        # Convert Pydantic errors to JSON-serializable format
-        errors = []
-        for err in e.errors():
-            # Create a clean dict with only JSON-serializable values
-            clean_err = {
-                "type": err.get("type"),
-                "loc": list(err.get("loc", [])),
-                "msg": err.get("msg"),
-            }
-            # Only include input if it's serializable
-            if "input" in err:
-                try:
-                    json.dumps(err["input"])  # Test if serializable
-                    clean_err["input"] = err["input"]
-                except (TypeError, ValueError):
-                    pass  # Skip non-serializable input
-            errors.append(clean_err)
-        return error_response("validation_error", 400, details=errors)
-
-    # 3) Convert into internal Item objects and keep request order
-    items = [
-        Item(
-            sku=i.sku,
-            l=i.dimensions.length,
-            w=i.dimensions.width,
-            h=i.dimensions.height,
-            order=idx,
-        )
-        for idx, i in enumerate(req.items)
-    ]
+    # 2) Validate input: fast path for well-formed payloads, Pydantic for the rest
+    items = _fast_validate(payload)
+    if items is None:
+        payload = _exact_payload(request.body, payload)
+        try:
+            req = PackRequest.model_validate(payload)
+        except ValidationError as e:
+            # Convert Pydantic errors to JSON-serializable format
+            errors = []
+            for err in e.errors():
+                # Create a clean dict with only JSON-serializable values
+                clean_err = {
+                    "type": err.get("type"),
+                    "loc": list(err.get("loc", [])),
+                    "msg": err.get("msg"),
+                }
+                # Only include input if it's serializable
+                if "input" in err:
+                    try:
+                        json.dumps(err["input"])  # Test if serializable
+                        clean_err["input"] = err["input"]
+                    except (TypeError, ValueError):
+                        pass  # Skip non-serializable input
+                errors.append(clean_err)
+            return error_response("validation_error", 400, details=errors)
+
+        # 3) Convert into internal Item objects and keep request order
+        items = [
+            Item(
+                sku=i.sku,
+                l=i.dimensions.length,
+                w=i.dimensions.width,
+                h=i.dimensions.height,
+                order=idx,
+            )
+            for idx, i in enumerate(req.items)
+        ]
 
     # 4) Pre-check: if any item can't fit in the largest box (in any rotation), return 422
     largest = _largest_box()
-    too_large = [it for it in items if not _fits_in_box(it, largest)]
+    too_large = [it for it in items if not fits_single(it, largest)]
     if too_large:
         return error_response(
             "item_too_large",
@@ -92,19 +95,8 @@ def pack(request: HttpRequest):
     ordered_skus = [it.sku for it in sorted(items, key=lambda x: x.order)]
 
     if single is not None:
-        resp = PackResponse(
-            boxes=[
-                PackedBox(
-                    box_id=single.box_id,
-                    dimensions=BoxOutDimensions(
-                        length=single.length, width=single.width, height=single.height
-                    ),
-                    items=ordered_skus,
-                )
-            ],
-            total_boxes=1,
-        )
-        return JsonResponse(resp.model_dump(), status=200)
+        resp = {"boxes": [_packed_box(single, ordered_skus)], "total_boxes": 1}
+        return _json_response(resp, status=200)
 
     # Case 2: multiple boxes
     try:
@@ -115,29 +107,57 @@ def pack(request: HttpRequest):
     resp_boxes = []
     for box, box_items in assignments:
         ordered_box_skus = [it.sku for it in sorted(box_items, key=lambda x: x.order)]
-        resp_boxes.append(
-            PackedBox(
-                box_id=box.box_id,
-                dimensions=BoxOutDimensions(length=box.length, width=box.width, height=box.height),
-                items=ordered_box_skus,
-            )
-        )
-
-    resp = PackResponse(boxes=resp_boxes, total_boxes=len(resp_boxes))
-    return JsonResponse(resp.model_dump(), status=200)
-
-
-def _fits_in_box(item: Item, box) -> bool:
-    b = (box.length, box.width, box.height)
-    dims = (item.l, item.w, item.h)
-
-    # any rotation allowed (all permutations)
-    rotations = set(permutations(dims, 3))
-    return any(l <= b[0] and w <= b[1] and h <= b[2] for (l, w, h) in rotations)
+        resp_boxes.append(_packed_box(box, ordered_box_skus))
+
+    resp = {"boxes": resp_boxes, "total_boxes": len(resp_boxes)}
+    return _json_response(resp, status=200)
+
+
+def _packed_box(box, skus):
+    # plain-dict form of schemas.PackedBox; PackResponse documents the shape
+    return {
+        "box_id": box.box_id,
+        "dimensions": {"length": box.length, "width": box.width, "height": box.height},
+        "items": skus,
+    }
+
+
+def _fast_validate(payload):
+    """
+    Hand-written check of the PackRequest schema for the common case.
+    Returns Items (in request order) only if the payload is plainly valid:
+    exact types, positive dims, unique non-empty skus. Returns None for
+    anything else so PackRequest produces the errors (or lax coercions).
+    """
+    if not isinstance(payload, dict):
+        return None
+    raw_items = payload.get("items")
+    if type(raw_items) is not list or not raw_items:
+        return None
+
+    items = []
+    seen = set()
+    for idx, raw in enumerate(raw_items):
+        if type(raw) is not dict:
+            return None
+        sku = raw.get("sku")
+        dims = raw.get("dimensions")
+        if type(sku) is not str or not sku or sku in seen or type(dims) is not dict:
+            return None
+        l, w, h = dims.get("length"), dims.get("width"), dims.get("height")
+        # type() rather than isinstance(): bool is an int subclass
+        if type(l) is not int or type(w) is not int or type(h) is not int:
+            return None
+        if l <= 0 or w <= 0 or h <= 0:
+            return None
+        seen.add(sku)
+        items.append(Item(sku=sku, l=l, w=w, h=h, order=idx))
+    return items
 
 
 def _largest_box():
-    return max(BOXES, key=lambda bx: bx.volume)
+    # BOXES_SORTED is built once at import, smallest->largest by volume
+    return BOXES_SORTED[-1]
 
 
 def error_response(code: str, status: int, details=None, ctx=None):
@@ -158,20 +178,40 @@ def error_response(code: str, status: int, details=None, ctx=None):
     if safe_ctx is not None:
         payload["ctx"] = safe_ctx
 
-    return JsonResponse(payload, status=status)
+    return _json_response(payload, status=status)
+
+
+def _json_response(data, status: int) -> HttpResponse:
+    # orjson emits bytes directly; no str round-trip as with JsonResponse
+    try:
+        body = orjson.dumps(data)
+    except orjson.JSONEncodeError:
+        # e.g. ints beyond 64 bits (Pydantic coerces numeric strings to them);
+        # the stdlib encoder handles them
+        body = json.dumps(data)
+    return HttpResponse(body, status=status, content_type="application/json")
+
+
+def _exact_payload(body: bytes, payload):
+    """
+    orjson reads integers beyond 64 bits as floats. For payloads headed to
+    Pydantic, re-parse with the stdlib so validation (and echoed inputs)
+    see the exact values; keep the orjson result if the stdlib can't.
+    """
+    try:
+        return json.loads(body or b"{}")
+    except (ValueError, RecursionError):
+        return payload
 
 
 def _json_safe(x):
     """Convert value to JSON-serializable format"""
-    if isinstance(x, Exception):
-        return str(x)
+    # dispatch on type; no speculative dumps probe (it re-serializes subtrees)
+    if x is None or isinstance(x, (str, int, float, bool)):
+        return x
     if isinstance(x, dict):
         return {k: _json_safe(v) for k, v in x.items()}
     if isinstance(x, (list, tuple)):
         return [_json_safe(item) for item in x]
-    # Test if it's JSON serializable
-    try:
-        json.dumps(x)
-        return x
-    except (TypeError, ValueError):
-        return str(x)
+    # Exceptions and anything else unknown
+    return str(x)